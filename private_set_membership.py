@@ -9,10 +9,546 @@ server's dataset S without revealing c to the server or learning any elements
 of S (except the membership result).
 """
 
-import random
-from typing import List, Tuple
+import asyncio
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import AsyncIterator, List, Optional, Tuple, Union
+
+import numpy as np
 from phe import paillier
 
+try:
+    # GMP-backed big integers for the modular arithmetic hot paths
+    from gmpy2 import invert, mpz, powmod, powmod_sec
+except ImportError:
+    # Pure-Python fallback, as phe itself does without gmpy2
+    from phe.util import invert, powmod
+    mpz = int
+    powmod_sec = None
+
+
+# Number of precomputed r_i^n values kept per key, and the bit length of the
+# short exponent used to re-randomize them. Short-exponent discrete logs fall
+# to square-root attacks, so 256 bits keeps ~128-bit security.
+OBFUSCATOR_TABLE_SIZE = 16
+OBFUSCATOR_EXPONENT_BITS = 256
+
+# Digit width in bits of the fixed-base comb tables used to draw obfuscators
+OBFUSCATOR_COMB_WINDOW = 4
+
+# Short-exponent draws from a table entry before its comb is built. A comb
+# costs about as much as the next 8 draws save over a plain exponentiation.
+OBFUSCATOR_COMB_THRESHOLD = 8
+
+# Default upper bound for the server's random blinding factor r
+MAX_BLINDING_FACTOR = 1000
+
+# Width of the signed-digit (wNAF) recoding used by _multi_exp
+MULTI_EXP_WINDOW = 5
+
+# Number of roots expanded directly at each leaf of the coefficient product tree
+PRODUCT_TREE_LEAF_SIZE = 128
+
+# Coefficient bound below which polynomial products stay in native int64
+INT64_LIMIT = 2 ** 63
+
+
+class _ObfuscatorTable:
+    """
+    Precomputed Paillier obfuscators r_i^n mod n^2 for a single public key.
+    
+    A fresh obfuscator is drawn as (r_j^n)^e = (r_j^e)^n for a random table
+    entry j and a short random exponent e, replacing the full-width
+    exponentiation r^n with a 256-bit one. Since the bases r_j^n are fixed,
+    each one gets a comb of its powers so that e costs one multiplication per
+    digit and no squarings.
+    
+    Everything is built on demand, so a key that only ever encrypts a few
+    values pays no more than plain encryption: an entry is computed (and
+    used as is) the first time it is drawn, and its comb only once it has
+    served OBFUSCATOR_COMB_THRESHOLD short-exponent draws.
+    """
+    
+    def __init__(self, public_key: paillier.PaillierPublicKey, size: int = OBFUSCATOR_TABLE_SIZE):
+        """
+        Set up an empty table for a public key.
+        
+        Args:
+            public_key: The Paillier public key the obfuscators belong to
+            size: Number of r_i^n values to keep
+        """
+        self.public_key = public_key
+        self.nsquare = mpz(public_key.nsquare)
+        self.table = [None] * size
+        self.combs = [None] * size
+        self.uses = [0] * size
+    
+    def _build_comb(self, base: mpz) -> List[List[mpz]]:
+        """
+        Precompute the fixed-base comb for one table entry.
+        
+        Args:
+            base: The table entry r_j^n
+            
+        Returns:
+            Rows where comb[i][d] = base^(d * 2^(w*i)) mod n^2, w being
+            OBFUSCATOR_COMB_WINDOW, covering OBFUSCATOR_EXPONENT_BITS bits
+        """
+        window = OBFUSCATOR_COMB_WINDOW
+        comb = []
+        
+        for _ in range(0, OBFUSCATOR_EXPONENT_BITS, window):
+            row = [mpz(1), base]
+            for _ in range(2, 1 << window):
+                row.append(row[-1] * base % self.nsquare)
+            comb.append(row)
+            base = row[-1] * base % self.nsquare  # Advance to base^(2^w)
+        
+        return comb
+    
+    def draw(self) -> mpz:
+        """Return a fresh random obfuscator (an n-th residue mod n^2)."""
+        j = secrets.randbelow(len(self.table))
+        base = self.table[j]
+        
+        if base is None:
+            # First draw of this entry: a full-width r^n is itself a fresh
+            # obfuscator, so return it and keep it as the entry
+            base = powmod(self.public_key.get_random_lt_n(), self.public_key.n, self.nsquare)
+            self.table[j] = base
+            return base
+        
+        exponent = secrets.randbits(OBFUSCATOR_EXPONENT_BITS) | 1
+        comb = self.combs[j]
+        
+        if comb is None:
+            self.uses[j] += 1
+            if self.uses[j] < OBFUSCATOR_COMB_THRESHOLD:
+                return powmod(base, exponent, self.nsquare)
+            comb = self.combs[j] = self._build_comb(base)
+        
+        window = OBFUSCATOR_COMB_WINDOW
+        mask = (1 << window) - 1
+        obfuscator = mpz(1)
+        
+        # One table multiplication per non-zero w-bit digit of the exponent
+        for row in comb:
+            digit = exponent & mask
+            if digit:
+                obfuscator = obfuscator * row[digit] % self.nsquare
+            exponent >>= window
+        
+        return obfuscator
+    
+    def draw_batch(self, count: int) -> List[mpz]:
+        """
+        Return a batch of fresh obfuscators.
+        
+        The exponentiations are independent of each other and of the
+        plaintexts, so this is the single place a multi-buffer modexp backend
+        would plug in.
+        
+        Args:
+            count: Number of obfuscators to draw
+            
+        Returns:
+            List of count independent obfuscators
+        """
+        return [self.draw() for _ in range(count)]
+
+
+def _raw_encrypt(
+    public_key: paillier.PaillierPublicKey,
+    plaintext: int,
+    obfuscator: Optional[mpz] = None
+) -> mpz:
+    """
+    Encrypt an integer directly, bypassing phe's generic encoding layer.
+    
+    Since g = n + 1, the message part g^m mod n^2 reduces to (1 + m*n) mod n^2
+    (binomial theorem), so the only exponentiation left is the obfuscator r^n.
+    
+    Args:
+        public_key: The Paillier public key to encrypt under
+        plaintext: Integer with abs(plaintext) <= public_key.max_int
+        obfuscator: Precomputed r^n mod n^2; a fresh one is computed if None
+        
+    Returns:
+        The raw ciphertext, as phe would store it for exponent 0
+    """
+    if abs(plaintext) > public_key.max_int:
+        raise ValueError(
+            f"Integer needs to be within +/- {public_key.max_int} but got {plaintext}"
+        )
+    
+    n = mpz(public_key.n)
+    nsquare = mpz(public_key.nsquare)
+    
+    # Negative values are represented as n - |m|, matching phe's encoding
+    nude_ciphertext = (1 + (plaintext % n) * n) % nsquare
+    if obfuscator is None:
+        obfuscator = powmod(public_key.get_random_lt_n(), n, nsquare)
+    
+    return (nude_ciphertext * obfuscator) % nsquare
+
+
+def _montgomery_ladder(base: mpz, exponent: int, modulus: mpz, bits: int) -> mpz:
+    """
+    Compute base^exponent mod modulus with a Montgomery ladder.
+    
+    Each of the bits steps performs exactly one multiplication and one
+    squaring, and the exponent bit only selects which of the two registers
+    receives which result, so the operation sequence does not depend on the
+    exponent.
+    
+    Args:
+        base: The value to exponentiate
+        exponent: Non-negative exponent below 2^bits
+        modulus: The modulus
+        bits: Number of exponent bits to process (fixed, to hide its length)
+        
+    Returns:
+        base^exponent mod modulus
+    """
+    registers = [mpz(1), base % modulus]
+    
+    for i in reversed(range(bits)):
+        bit = (exponent >> i) & 1
+        registers[1 - bit] = registers[0] * registers[1] % modulus
+        registers[bit] = registers[bit] * registers[bit] % modulus
+    
+    return registers[0]
+
+
+def _powmod_secret(base: mpz, exponent: int, modulus: mpz, bits: int) -> mpz:
+    """
+    Exponentiate with a secret exponent without leaking it through timing.
+    
+    Uses GMP's side-channel resistant mpz_powm_sec when gmpy2 is available
+    (the modulus must be odd, as n^2 is), and a Montgomery ladder otherwise.
+    
+    Args:
+        base: The value to exponentiate
+        exponent: Positive secret exponent below 2^bits
+        modulus: The odd modulus
+        bits: Upper bound on the exponent's bit length
+        
+    Returns:
+        base^exponent mod modulus
+    """
+    if powmod_sec is not None:
+        return powmod_sec(base, exponent, modulus)
+    return _montgomery_ladder(base, exponent, modulus, bits)
+
+
+class EncryptedVector:
+    """
+    A sequence of integer ciphertexts under one public key.
+    
+    Stored as a single object array of raw ciphertexts plus one shared
+    public key, instead of one EncryptedNumber per element. Indexing and
+    iteration still yield EncryptedNumber objects for use with phe.
+    """
+    
+    def __init__(self, public_key: paillier.PaillierPublicKey, ciphertexts: np.ndarray):
+        """
+        Wrap raw ciphertexts.
+        
+        Args:
+            public_key: The public key all ciphertexts are encrypted under
+            ciphertexts: Raw ciphertexts (exponent 0), as an object array
+        """
+        self.public_key = public_key
+        self.ciphertexts = ciphertexts
+    
+    @classmethod
+    def from_encrypted_numbers(
+        cls,
+        public_key: paillier.PaillierPublicKey,
+        encrypted_numbers: List[paillier.EncryptedNumber]
+    ) -> "EncryptedVector":
+        """
+        Collect EncryptedNumber objects into a vector.
+        
+        Args:
+            public_key: The public key the numbers must be encrypted under
+            encrypted_numbers: Encrypted integers (exponent 0)
+            
+        Returns:
+            EncryptedVector holding the same ciphertexts
+        """
+        ciphertexts = np.empty(len(encrypted_numbers), dtype=object)
+        for i, encrypted_number in enumerate(encrypted_numbers):
+            if encrypted_number.public_key != public_key:
+                raise ValueError("Encrypted values use a different public key")
+            if encrypted_number.exponent != 0:
+                raise ValueError("Encrypted values must encode integers")
+            ciphertexts[i] = mpz(encrypted_number.ciphertext(be_secure=False))
+        return cls(public_key, ciphertexts)
+    
+    def __len__(self) -> int:
+        return len(self.ciphertexts)
+    
+    def __getitem__(self, index: int) -> paillier.EncryptedNumber:
+        return paillier.EncryptedNumber(self.public_key, int(self.ciphertexts[index]), 0)
+    
+    def __iter__(self):
+        for index in range(len(self.ciphertexts)):
+            yield self[index]
+
+
+def _wnaf(value: int, width: int) -> List[Tuple[int, int]]:
+    """
+    Width-w non-adjacent form of an integer.
+    
+    Every non-zero digit is odd with absolute value below 2^(w-1), and any w
+    consecutive digits contain at most one non-zero digit.
+    
+    The binary expansion of |value| is walked once with a carry, so the
+    recoding is linear in the bit length; shifting and subtracting on the
+    integer itself would copy it at every step.
+    
+    Args:
+        value: The integer to recode (may be negative)
+        width: The window width w
+        
+    Returns:
+        The non-zero digits as (position, digit) pairs, least significant
+        first, with value = sum(digit * 2^position)
+    """
+    bits = bin(abs(value))[:1:-1]  # Least significant bit first
+    sign = -1 if value < 0 else 1
+    digits = []
+    carry = 0
+    position = 0
+    
+    while True:
+        # Windows stay even (digit 0) across 0 bits without a carry and
+        # across 1 bits with one, so jump straight to the next odd window
+        position = bits.find("0" if carry else "1", position)
+        if position < 0:
+            break
+        window = int(bits[position:position + width][::-1], 2) + carry
+        digit = window if window < 1 << (width - 1) else window - (1 << width)
+        carry = (window - digit) >> width
+        digits.append((position, sign * digit))
+        position += width
+    
+    if carry:
+        # Final carry out of the top window
+        last = digits[-1][0] + width if digits else 0
+        digits.append((max(last, len(bits)), sign))
+    
+    return digits
+
+
+class _ExponentSchedule:
+    """
+    Precomputed signed-digit (wNAF) recoding of fixed exponents, for _multi_exp.
+    
+    The digits are stored column by column (one column per bit position,
+    most significant first), keeping only the non-zero ones, so zero digits
+    cost nothing at evaluation time. Signed digits need about a third fewer
+    multiplications than unsigned windows and cover negative exponents
+    without inverting the bases.
+    """
+    
+    def __init__(self, exponents: List[int]):
+        """
+        Recode the exponents.
+        
+        Args:
+            exponents: Exponents (of any sign), one per base of _multi_exp
+        """
+        recoded = [_wnaf(exponent, MULTI_EXP_WINDOW) for exponent in exponents]
+        num_positions = max((digits[-1][0] + 1 for digits in recoded if digits), default=0)
+        
+        self.columns = [[] for _ in range(num_positions)]
+        self.max_digits = [0] * len(exponents)
+        
+        for term, digits in enumerate(recoded):
+            for position, digit in digits:
+                self.columns[num_positions - 1 - position].append((term, digit))
+            self.max_digits[term] = max((abs(digit) for _, digit in digits), default=0)
+
+
+def _multi_exp(bases: List[mpz], schedule: _ExponentSchedule, modulus: mpz) -> mpz:
+    """
+    Compute prod(base_i ^ exponent_i) mod modulus.
+    
+    Horner's rule over the exponents' signed digits (Straus' simultaneous
+    exponentiation): all bases share a single chain of squarings, so each
+    extra base costs one multiplication per non-zero digit rather than a
+    full exponentiation of its own. Negative digits go to a second
+    accumulator, which is inverted once at the end.
+    
+    Args:
+        bases: Values to exponentiate, invertible mod modulus
+        schedule: The recoded exponents, one per base
+        modulus: The modulus (n^2 for Paillier ciphertexts)
+        
+    Returns:
+        The product of all base_i ^ exponent_i, reduced mod modulus
+    """
+    # Odd powers: tables[i][j] = base_i^(2j + 1), up to the largest digit used
+    tables = []
+    for base, max_digit in zip(bases, schedule.max_digits):
+        table = [base]
+        if max_digit > 1:
+            base_squared = base * base % modulus
+            for _ in range(max_digit // 2):
+                table.append(table[-1] * base_squared % modulus)
+        tables.append(table)
+    
+    positive = 1
+    negative = 1
+    
+    # Walk the bit positions from most to least significant
+    for column in schedule.columns:
+        positive = positive * positive % modulus
+        negative = negative * negative % modulus
+        for term, digit in column:
+            if digit > 0:
+                positive = positive * tables[term][digit >> 1] % modulus
+            else:
+                negative = negative * tables[term][-digit >> 1] % modulus
+    
+    if negative == 1:
+        return positive
+    return positive * invert(negative, modulus) % modulus
+
+
+def _parallel_multi_exp(
+    groups: List[Tuple[List[mpz], _ExponentSchedule]],
+    modulus: mpz,
+    executor: Optional[ProcessPoolExecutor] = None
+) -> mpz:
+    """
+    Compute _multi_exp for several groups of terms and multiply the results.
+    
+    With an executor and more than one group, each group is evaluated in a
+    worker process. Processes are used because the big-integer arithmetic
+    holds the GIL.
+    
+    Args:
+        groups: (bases, schedule) pairs, as accepted by _multi_exp
+        modulus: The modulus (n^2 for Paillier ciphertexts)
+        executor: Optional process pool to run the groups in
+        
+    Returns:
+        The product over all groups, reduced mod modulus
+    """
+    if executor is None or len(groups) <= 1:
+        partials = (_multi_exp(bases, schedule, modulus) for bases, schedule in groups)
+    else:
+        partials = executor.map(
+            _multi_exp,
+            [bases for bases, _ in groups],
+            [schedule for _, schedule in groups],
+            repeat(modulus)
+        )
+    
+    result = 1
+    for partial in partials:
+        result = result * partial % modulus
+    
+    return result
+
+
+def _poly_from_roots(roots: List[int]) -> List[int]:
+    """
+    Expand (x - r1)(x - r2)...(x - rm) one root at a time.
+    
+    Args:
+        roots: The non-empty list of roots
+        
+    Returns:
+        Coefficients from the leading term down to the constant term
+    """
+    # Every coefficient of a partial product is bounded by prod(1 + |r_i|),
+    # so native int64 arithmetic is exact while that bound stays below 2^63.
+    # Once it does not, continue with object dtype (exact Python ints).
+    bound = 1 + abs(roots[0])
+    dtype = np.int64 if bound < INT64_LIMIT else object
+    
+    # Initialize coefficients: start with polynomial (x - r1)
+    # For (x - r1), coefficients are [1, -r1]
+    coeffs = np.array([1, -roots[0]], dtype=dtype)
+    
+    # Multiply by (x - r_i) for each remaining root
+    for r_i in roots[1:]:
+        bound *= 1 + abs(r_i)
+        if coeffs.dtype != object and bound >= INT64_LIMIT:
+            coeffs = coeffs.astype(object)
+        
+        # (a_m*x^m + ... + a_0) * (x - r_i): shift by x, then subtract
+        # r_i times the old coefficients, as whole-array operations
+        new_coeffs = np.empty(len(coeffs) + 1, dtype=coeffs.dtype)
+        new_coeffs[:-1] = coeffs
+        new_coeffs[-1] = 0
+        new_coeffs[1:] -= coeffs * r_i
+        coeffs = new_coeffs
+    
+    return coeffs.tolist()
+
+
+def _pack_coefficients(coeffs: List[int], width: int) -> int:
+    """Concatenate non-negative coefficients as fixed-width big-endian fields."""
+    return int.from_bytes(
+        b"".join(c.to_bytes(width, "big") for c in coeffs), "big"
+    )
+
+
+def _poly_mul(a: List[int], b: List[int]) -> List[int]:
+    """
+    Multiply two integer polynomials by Kronecker substitution.
+    
+    Both polynomials are evaluated at x = 2^k (packing the coefficients into
+    one big integer each), multiplied as integers, and the product's
+    coefficients are read back from its k-bit fields. This hands the work to
+    the big-integer multiplication, which is subquadratic (FFT-based in GMP).
+    
+    Args:
+        a: Coefficients of the first polynomial, leading term first
+        b: Coefficients of the second polynomial, leading term first
+        
+    Returns:
+        Coefficients of a*b, leading term first
+    """
+    # Each product coefficient is bounded by this, so a signed field of one
+    # more bit holds it exactly
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+    width = (bound.bit_length() + 1 + 7) // 8  # Bytes per field
+    
+    # Negative coefficients: pack positive and negative parts separately
+    def evaluate(coeffs):
+        return (
+            _pack_coefficients([max(c, 0) for c in coeffs], width)
+            - _pack_coefficients([max(-c, 0) for c in coeffs], width)
+        )
+    
+    length = len(a) + len(b) - 1
+    product = int(mpz(evaluate(a)) * mpz(evaluate(b)))
+    data = product.to_bytes(length * width, "big", signed=True)
+    
+    # Read the fields from the lowest up; a negative coefficient borrowed
+    # one from the field above it, so carry that back
+    field = 1 << (8 * width)
+    half = field >> 1
+    coeffs = []
+    carry = 0
+    for end in range(len(data), 0, -width):
+        c = int.from_bytes(data[end - width:end], "big") + carry
+        carry = 0
+        if c >= half:
+            c -= field
+            carry = 1
+        coeffs.append(c)
+    
+    coeffs.reverse()
+    return coeffs
+
 
 class Client:
     """
@@ -26,6 +562,7 @@ class Client:
         """Initialize the client with no keys (keys generated during protocol)."""
         self.public_key = None
         self.private_key = None
+        self._obfuscators = None
     
     def generate_keys(self, key_length: int = 1024) -> paillier.PaillierPublicKey:
         """
@@ -40,7 +577,21 @@ class Client:
         self.public_key, self.private_key = paillier.generate_paillier_keypair(n_length=key_length)
         return self.public_key
     
-    def encrypt_query(self, c: int, n: int) -> List[paillier.EncryptedNumber]:
+    def _obfuscator_table(self) -> _ObfuscatorTable:
+        """
+        Return the obfuscator table for the current public key.
+        
+        The table is (re)built whenever public_key has changed, including
+        keys assigned directly rather than through generate_keys().
+        
+        Returns:
+            The _ObfuscatorTable for self.public_key
+        """
+        if self._obfuscators is None or self._obfuscators.public_key != self.public_key:
+            self._obfuscators = _ObfuscatorTable(self.public_key)
+        return self._obfuscators
+    
+    def encrypt_query(self, c: int, n: int) -> EncryptedVector:
         """
         Encrypt the query c and all necessary powers c^k for k in [1, n].
         
@@ -49,19 +600,57 @@ class Client:
             n: The degree of the polynomial (size of server's set)
             
         Returns:
-            List of encrypted values [Epk(c), Epk(c^2), ..., Epk(c^n)]
+            Encrypted values [Epk(c), Epk(c^2), ..., Epk(c^n)]
         """
         if self.public_key is None:
             raise ValueError("Keys must be generated first. Call generate_keys()")
         
-        encrypted_powers = []
+        powers = []
         current_power = 1
         
         for k in range(1, n + 1):
             current_power = current_power * c  # Compute c^k
-            encrypted_powers.append(self.public_key.encrypt(current_power))
+            powers.append(current_power)
+        
+        # The obfuscators do not depend on the plaintexts: draw them as one batch
+        obfuscators = self._obfuscator_table().draw_batch(n)
+        
+        ciphertexts = np.empty(n, dtype=object)
+        for i, (power, obfuscator) in enumerate(zip(powers, obfuscators)):
+            ciphertexts[i] = _raw_encrypt(self.public_key, power, obfuscator)
+        
+        return EncryptedVector(self.public_key, ciphertexts)
+    
+    async def encrypt_query_stream(
+        self,
+        c: int,
+        n: int
+    ) -> AsyncIterator[paillier.EncryptedNumber]:
+        """
+        Encrypt c^k for k in [1, n], yielding each ciphertext once it is ready.
+        
+        Streaming counterpart of encrypt_query, for
+        Server.evaluate_polynomial_stream.
+        
+        Args:
+            c: The private query value
+            n: The degree of the polynomial (size of server's set)
+            
+        Yields:
+            Epk(c), Epk(c^2), ..., Epk(c^n) in order
+        """
+        if self.public_key is None:
+            raise ValueError("Keys must be generated first. Call generate_keys()")
+        
+        obfuscators = self._obfuscator_table()
+        current_power = 1
         
-        return encrypted_powers
+        for k in range(1, n + 1):
+            current_power = current_power * c  # Compute c^k
+            ciphertext = _raw_encrypt(
+                self.public_key, current_power, obfuscators.draw()
+            )
+            yield paillier.EncryptedNumber(self.public_key, int(ciphertext), 0)
     
     def decrypt_result(self, encrypted_result: paillier.EncryptedNumber) -> int:
         """
@@ -76,7 +665,23 @@ class Client:
         if self.private_key is None:
             raise ValueError("Private key not available")
         
-        return self.private_key.decrypt(encrypted_result)
+        public_key = self.private_key.public_key
+        if encrypted_result.public_key != public_key or encrypted_result.exponent != 0:
+            # Not one of ours; let phe validate and decode it
+            return self.private_key.decrypt(encrypted_result)
+        
+        # CRT decryption: m mod p and m mod q from half-width exponentiations
+        # mod p^2 and q^2 (using phe's precomputed hp, hq), recombined mod n
+        plaintext = self.private_key.raw_decrypt(
+            encrypted_result.ciphertext(be_secure=False)
+        )
+        
+        # Map back to a signed integer, as phe's EncodedNumber.decode does
+        if plaintext <= public_key.max_int:
+            return plaintext
+        if plaintext >= public_key.n - public_key.max_int:
+            return plaintext - public_key.n
+        raise OverflowError("Overflow detected in decrypted result")
     
     def check_membership(self, decrypted_result: int) -> bool:
         """
@@ -99,16 +704,54 @@ class Server:
     without learning the client's query or revealing elements of S.
     """
     
-    def __init__(self, dataset: List[int]):
+    def __init__(self, dataset: List[int], max_workers: int = 1):
         """
         Initialize the server with a dataset.
         
         Args:
             dataset: The server's private set S = {s1, s2, ..., sn}
+            max_workers: Number of processes used for homomorphic evaluation
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        
         self.dataset = list(set(dataset))  # Remove duplicates and convert to list
         self.n = len(self.dataset)
+        self.max_workers = max_workers
+        self._executor = None  # Created on first use, see _get_executor()
         self.coefficients = self._compute_polynomial_coefficients()
+        self.nonzero_terms = [
+            (k, self.coefficients[self.n - k])  # a_n is at index 0, a_1 at n-1
+            for k in range(1, self.n + 1)
+            if self.coefficients[self.n - k] != 0
+        ]
+        self._term_groups = self._prepare_exponents()
+    
+    def __enter__(self) -> "Server":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Return the server's process pool, starting it on first use.
+        
+        The pool is kept for the lifetime of the server, so its startup cost
+        is paid once rather than on every query.
+        
+        Returns:
+            The process pool, or None when max_workers is 1
+        """
+        if self.max_workers > 1 and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
     
     def _compute_polynomial_coefficients(self) -> List[int]:
         """
@@ -124,33 +767,55 @@ class Server:
         if self.n == 0:
             return [1]  # Empty polynomial: PS(x) = 1
         
-        # Initialize coefficients: start with polynomial (x - s1)
-        # For (x - s1), coefficients are [1, -s1]
-        coeffs = [1, -self.dataset[0]]
+        # Balanced product tree: expand blocks of roots directly, then
+        # multiply neighbouring polynomials pairwise until one remains, so
+        # the large multiplications happen between operands of equal size
+        size = PRODUCT_TREE_LEAF_SIZE
+        polys = [
+            _poly_from_roots(self.dataset[i:i + size])
+            for i in range(0, self.n, size)
+        ]
         
-        # Multiply by (x - s_i) for each remaining element
-        for s_i in self.dataset[1:]:
-            # Multiply current polynomial by (x - s_i)
-            # If current poly is a_n*x^n + ... + a_0, then
-            # (a_n*x^n + ... + a_0) * (x - s_i) = a_n*x^{n+1} + ... + (a_0)*(-s_i)
-            new_coeffs = [0] * (len(coeffs) + 1)
-            
-            # Multiply by x: shift coefficients
-            for i in range(len(coeffs)):
-                new_coeffs[i] = coeffs[i]
-            
-            # Multiply by -s_i: scale and add
-            for i in range(len(coeffs)):
-                new_coeffs[i + 1] += coeffs[i] * (-s_i)
-            
-            coeffs = new_coeffs
+        while len(polys) > 1:
+            merged = [
+                _poly_mul(polys[i], polys[i + 1])
+                for i in range(0, len(polys) - 1, 2)
+            ]
+            if len(polys) % 2:
+                merged.append(polys[-1])  # Odd one out moves up a level
+            polys = merged
+        
+        return polys[0]
+    
+    def _prepare_exponents(self) -> List[Tuple[List[int], _ExponentSchedule]]:
+        """
+        Precompute the coefficient data used by evaluate_polynomial_homomorphic.
+        
+        The coefficients are fixed per dataset, so they are recoded once here
+        rather than on every query.
+        
+        Returns:
+            The non-zero terms split into max_workers contiguous groups, each
+            a list of powers k and the schedule of the matching a_k
+        """
+        terms = self.nonzero_terms
+        group_size = max(1, -(-len(terms) // self.max_workers))  # Ceiling division
         
-        return coeffs
+        term_groups = []
+        for start in range(0, len(terms), group_size):
+            group = terms[start:start + group_size]
+            term_groups.append((
+                [k for k, _ in group],
+                _ExponentSchedule([a_k for _, a_k in group])
+            ))
+        
+        return term_groups
     
     def evaluate_polynomial_homomorphic(
         self,
         public_key: paillier.PaillierPublicKey,
-        encrypted_powers: List[paillier.EncryptedNumber]
+        encrypted_powers: Union[EncryptedVector, List[paillier.EncryptedNumber]],
+        blinding: Optional[int] = None
     ) -> paillier.EncryptedNumber:
         """
         Evaluate PS(c) homomorphically using encrypted powers of c.
@@ -159,38 +824,169 @@ class Server:
         
         Args:
             public_key: The client's public key
-            encrypted_powers: List [Epk(c), Epk(c^2), ..., Epk(c^n)]
+            encrypted_powers: [Epk(c), Epk(c^2), ..., Epk(c^n)], as an
+                EncryptedVector or a list of EncryptedNumber
+            blinding: Optional blinding factor r >= 1 from
+                draw_blinding_factor(); if given, Epk(r * PS(c)) is returned
+                in the same pass
             
         Returns:
-            Encrypted result Epk(PS(c))
+            Encrypted result Epk(PS(c)), or Epk(r * PS(c)) when blinded
         """
+        if blinding is not None and blinding < 1:
+            raise ValueError(f"Blinding factor must be at least 1, got {blinding}")
+        
         if len(encrypted_powers) != self.n:
             raise ValueError(
                 f"Expected {self.n} encrypted powers, got {len(encrypted_powers)}"
             )
         
-        # Start with the constant term a_0
-        # Epk(a_0) = encrypt a_0 directly
-        result = public_key.encrypt(self.coefficients[-1])
-        
-        # Add each term a_k * c^k for k from 1 to n
-        # Epk(a_k * c^k) = (Epk(c^k))^a_k (homomorphic scalar multiplication)
-        for k in range(1, self.n + 1):
-            coeff_index = self.n - k  # a_n is at index 0, a_1 is at index n-1
-            a_k = self.coefficients[coeff_index]
+        if not isinstance(encrypted_powers, EncryptedVector):
+            encrypted_powers = EncryptedVector.from_encrypted_numbers(
+                public_key, encrypted_powers
+            )
+        elif encrypted_powers.public_key != public_key:
+            raise ValueError("Encrypted powers use a different public key")
+        
+        ciphertexts = encrypted_powers.ciphertexts
+        nsquare = mpz(public_key.nsquare)
+        
+        # Epk(a_k * c^k) = (Epk(c^k))^a_k, and adding ciphertexts multiplies
+        # them, so the sum over k is the multi-exponentiation
+        # prod_k Epk(c^k)^a_k. Coefficients a_k = +/-1 cost one multiplication.
+        groups = [
+            ([ciphertexts[k - 1] for k in powers], schedule)
+            for powers, schedule in self._term_groups
+        ]
+        product = _parallel_multi_exp(groups, nsquare, self._get_executor())
+        
+        return self._finish_evaluation(public_key, product, blinding)
+    
+    async def evaluate_polynomial_stream(
+        self,
+        public_key: paillier.PaillierPublicKey,
+        encrypted_powers: AsyncIterator[paillier.EncryptedNumber],
+        blinding: Optional[int] = None
+    ) -> paillier.EncryptedNumber:
+        """
+        Evaluate PS(c) homomorphically while the encrypted powers arrive.
+        
+        Streaming counterpart of evaluate_polynomial_homomorphic: as soon as
+        all powers needed by a group of terms have been received, that
+        group's multi-exponentiation starts in a worker process, overlapping
+        with the production of the remaining powers.
+        
+        Args:
+            public_key: The client's public key
+            encrypted_powers: Async iterator yielding Epk(c), Epk(c^2), ...,
+                Epk(c^n) in order, e.g. Client.encrypt_query_stream()
+            blinding: Optional blinding factor r >= 1 from draw_blinding_factor()
+            
+        Returns:
+            Encrypted result Epk(PS(c)), or Epk(r * PS(c)) when blinded
+        """
+        if blinding is not None and blinding < 1:
+            raise ValueError(f"Blinding factor must be at least 1, got {blinding}")
+        
+        loop = asyncio.get_running_loop()
+        nsquare = mpz(public_key.nsquare)
+        groups = iter(self._term_groups)
+        next_group = next(groups, None)
+        ciphertexts = []
+        pending = []
+        
+        executor = self._get_executor()
+        
+        try:
+            async for encrypted_power in encrypted_powers:
+                if encrypted_power.public_key != public_key:
+                    raise ValueError("Encrypted powers use a different public key")
+                if encrypted_power.exponent != 0:
+                    raise ValueError("Encrypted powers must encode integers")
+                ciphertexts.append(mpz(encrypted_power.ciphertext(be_secure=False)))
+                
+                # Groups cover increasing powers k; start every complete one
+                while next_group is not None and next_group[0][-1] <= len(ciphertexts):
+                    powers, schedule = next_group
+                    bases = [ciphertexts[k - 1] for k in powers]
+                    pending.append(loop.run_in_executor(
+                        executor, _multi_exp, bases, schedule, nsquare
+                    ))
+                    next_group = next(groups, None)
+            
+            if len(ciphertexts) != self.n:
+                raise ValueError(
+                    f"Expected {self.n} encrypted powers, got {len(ciphertexts)}"
+                )
+        except BaseException:
+            # Don't leave jobs behind in the persistent pool: cancel those
+            # not yet started and wait for the running ones before re-raising
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+        
+        partials = await asyncio.gather(*pending)
+        
+        product = 1
+        for partial in partials:
+            product = product * partial % nsquare
+        
+        return self._finish_evaluation(public_key, product, blinding)
+    
+    def _finish_evaluation(
+        self,
+        public_key: paillier.PaillierPublicKey,
+        product: mpz,
+        blinding: Optional[int]
+    ) -> paillier.EncryptedNumber:
+        """
+        Add the constant term to prod_k Epk(c^k)^a_k and optionally blind.
+        
+        Args:
+            public_key: The client's public key
+            product: The multi-exponentiation over the terms with k >= 1
+            blinding: Optional blinding factor r
             
-            if a_k != 0:
-                # Compute Epk(a_k * c^k) = (Epk(c^k))^a_k
-                encrypted_term = encrypted_powers[k - 1] * a_k
-                # Add to result: Epk(result + a_k*c^k)
-                result = result + encrypted_term
+        Returns:
+            Encrypted result Epk(PS(c)), or Epk(r * PS(c)) when blinded
+        """
+        nsquare = mpz(public_key.nsquare)
         
-        return result
+        # Start with the constant term a_0
+        # Epk(a_0) = encrypt a_0 directly, with a fresh full-width r^n. The
+        # client knows p and q, so any structure shared between the server's
+        # obfuscators (such as a common base) would leak through the result.
+        constant_term = _raw_encrypt(public_key, self.coefficients[-1])
+        ciphertext = constant_term * product % nsquare
+        
+        if blinding is not None:
+            # Epk(r * PS(c)) = (Epk(PS(c)))^r, applied to the raw accumulator
+            ciphertext = _powmod_secret(
+                ciphertext,
+                blinding,
+                nsquare,
+                max(blinding.bit_length(), MAX_BLINDING_FACTOR.bit_length())
+            )
+        
+        return paillier.EncryptedNumber(public_key, int(ciphertext), 0)
+    
+    def draw_blinding_factor(self, max_blinding_factor: int = MAX_BLINDING_FACTOR) -> int:
+        """
+        Draw a random non-zero blinding factor r.
+        
+        Args:
+            max_blinding_factor: Maximum value for the random blinding factor
+            
+        Returns:
+            r, uniform in [1, max_blinding_factor]
+        """
+        return secrets.randbelow(max_blinding_factor) + 1
     
     def blind_and_return(
         self,
         encrypted_result: paillier.EncryptedNumber,
-        max_blinding_factor: int = 1000
+        max_blinding_factor: int = MAX_BLINDING_FACTOR
     ) -> paillier.EncryptedNumber:
         """
         Blind the encrypted result with a random non-zero factor.
@@ -206,18 +1002,28 @@ class Server:
             Blinded encrypted result Epk(r * PS(c))
         """
         # Generate random non-zero blinding factor
-        r = random.randint(1, max_blinding_factor)
+        r = self.draw_blinding_factor(max_blinding_factor)
         
-        # Compute Epk(r * PS(c)) = (Epk(PS(c)))^r
-        blinded_result = encrypted_result * r
+        # Compute Epk(r * PS(c)) = (Epk(PS(c)))^r, in constant time since r
+        # must stay hidden from the client
+        public_key = encrypted_result.public_key
+        ciphertext = _powmod_secret(
+            mpz(encrypted_result.ciphertext(be_secure=False)),
+            r,
+            mpz(public_key.nsquare),
+            max_blinding_factor.bit_length()
+        )
         
-        return blinded_result
+        return paillier.EncryptedNumber(
+            public_key, int(ciphertext), encrypted_result.exponent
+        )
 
 
 def run_protocol(
     client_query: int,
     server_dataset: List[int],
-    key_length: int = 1024
+    key_length: int = 1024,
+    max_workers: int = 1
 ) -> Tuple[bool, dict]:
     """
     Run the complete Private Set-Membership Test protocol.
@@ -226,6 +1032,7 @@ def run_protocol(
         client_query: The client's private query c
         server_dataset: The server's private dataset S
         key_length: Bit length for Paillier keys
+        max_workers: Number of processes the server uses for evaluation
         
     Returns:
         Tuple of (membership_result, protocol_info)
@@ -233,23 +1040,36 @@ def run_protocol(
     """
     # Initialize parties
     client = Client()
-    server = Server(server_dataset)
+    server = Server(server_dataset, max_workers)
     
     # Step 1: Client generates keys
     public_key = client.generate_keys(key_length)
     
     # Step 2: Client encrypts query and powers
-    encrypted_powers = client.encrypt_query(client_query, server.n)
-    
-    # Step 3: Server evaluates polynomial homomorphically
-    encrypted_polynomial_value = server.evaluate_polynomial_homomorphic(
-        public_key, encrypted_powers
-    )
+    # Step 3: Server evaluates polynomial homomorphically and blinds the
+    # result with a random factor r in the same pass
+    try:
+        asyncio.get_running_loop()
+        in_event_loop = True  # e.g. Jupyter, where asyncio.run() would fail
+    except RuntimeError:
+        in_event_loop = False
     
-    # Step 4: Server blinds the result
-    blinded_result = server.blind_and_return(encrypted_polynomial_value)
+    with server:  # Shuts the server's worker processes down afterwards
+        if max_workers > 1 and not in_event_loop:
+            # Pipeline the two steps: the server's workers start on each group
+            # of terms while the client is still encrypting later powers
+            blinded_result = asyncio.run(server.evaluate_polynomial_stream(
+                public_key,
+                client.encrypt_query_stream(client_query, server.n),
+                blinding=server.draw_blinding_factor()
+            ))
+        else:
+            encrypted_powers = client.encrypt_query(client_query, server.n)
+            blinded_result = server.evaluate_polynomial_homomorphic(
+                public_key, encrypted_powers, blinding=server.draw_blinding_factor()
+            )
     
-    # Step 5: Client decrypts and checks membership
+    # Step 4: Client decrypts and checks membership
     decrypted_result = client.decrypt_result(blinded_result)
     is_member = client.check_membership(decrypted_result)
     